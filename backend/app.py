@@ -1,14 +1,20 @@
 """FastAPI backend powering the short-film script generator."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from dataclasses import asdict
+import threading
+from collections import OrderedDict, defaultdict
+from contextlib import asynccontextmanager
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, AsyncIterator, Callable, Dict, Hashable, List, Sequence
 
+import orjson
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, Extra, Field
 
 from pipeline import StoryPipelineController
 from pipeline.models import (
@@ -23,7 +29,15 @@ from pipeline.production import KenBurnsFilmBuilder
 
 logger = logging.getLogger("backend")
 
-app = FastAPI(title="Short Film Script Generator", version="1.0.0")
+
+@asynccontextmanager
+async def _lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """Release the media builder's speech engine when the server stops."""
+    yield
+    media_builder.close()
+
+
+app = FastAPI(title="Short Film Script Generator", version="1.0.0", lifespan=_lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -37,7 +51,41 @@ class GenerateScriptRequest(BaseModel):
     story_text: str = Field(..., description="Narrative text describing the story")
 
 
-class AssetPlanResponse(BaseModel):
+def _slot_copier(response_type: type[BaseModel]) -> Callable[[Any], Dict[str, Any]]:
+    """Build a shallow field-mapping reader for a slotted dataclass.
+
+    The names come from the response schema, not the dataclass, because
+    ``construct`` keeps unknown keys and ``.dict()`` would publish any internal
+    field added to the pipeline model later. They and their ``attrgetter`` are
+    resolved once, so each call is a single C-level multi-attribute fetch
+    instead of ``asdict``'s deep copy.
+    """
+    field_names = tuple(response_type.__fields__)
+    read_fields = attrgetter(*field_names)
+    if "metadata" not in field_names:
+        return lambda instance: dict(zip(field_names, read_fields(instance)))
+
+    def read_with_metadata_copy(instance: Any) -> Dict[str, Any]:
+        # Cached responses outlive the request; copy the live metadata dict so
+        # later changes to the pipeline model cannot reach a shared response.
+        values = dict(zip(field_names, read_fields(instance)))
+        values["metadata"] = dict(values["metadata"])
+        return values
+
+    return read_with_metadata_copy
+
+
+class _ResponseModel(BaseModel):
+    """Base for outgoing payloads: immutable and strict about unexpected keys."""
+
+    class Config:
+        extra = Extra.forbid
+        frozen = True
+
+
+# Response models are populated from pipeline dataclasses we produced ourselves, so
+# `from_model` uses `construct` to skip re-validating data that is already well-typed.
+class AssetPlanResponse(_ResponseModel):
     identifier: str
     asset_type: str
     description: str
@@ -49,10 +97,13 @@ class AssetPlanResponse(BaseModel):
 
     @classmethod
     def from_model(cls, model: AssetPlan) -> "AssetPlanResponse":
-        return cls(**asdict(model))
+        return cls.construct(**_asset_fields(model))
+
 
+_asset_fields = _slot_copier(AssetPlanResponse)
 
-class TTSChunkResponse(BaseModel):
+
+class TTSChunkResponse(_ResponseModel):
     identifier: str
     text: str
     chunk_index: int
@@ -62,10 +113,13 @@ class TTSChunkResponse(BaseModel):
 
     @classmethod
     def from_model(cls, model: TTSChunk) -> "TTSChunkResponse":
-        return cls(**asdict(model))
+        return cls.construct(**_tts_chunk_fields(model))
+
 
+_tts_chunk_fields = _slot_copier(TTSChunkResponse)
 
-class KenBurnsSegmentResponse(BaseModel):
+
+class KenBurnsSegmentResponse(_ResponseModel):
     identifier: str
     asset_identifier: str
     duration: float
@@ -76,10 +130,13 @@ class KenBurnsSegmentResponse(BaseModel):
 
     @classmethod
     def from_model(cls, model: KenBurnsSegment) -> "KenBurnsSegmentResponse":
-        return cls(**asdict(model))
+        return cls.construct(**_ken_burns_segment_fields(model))
+
 
+_ken_burns_segment_fields = _slot_copier(KenBurnsSegmentResponse)
 
-class VideoClipReferenceResponse(BaseModel):
+
+class VideoClipReferenceResponse(_ResponseModel):
     identifier: str
     source_uri: str
     duration: float
@@ -88,10 +145,13 @@ class VideoClipReferenceResponse(BaseModel):
 
     @classmethod
     def from_model(cls, model: VideoClipReference) -> "VideoClipReferenceResponse":
-        return cls(**asdict(model))
+        return cls.construct(**_video_clip_fields(model))
+
 
+_video_clip_fields = _slot_copier(VideoClipReferenceResponse)
 
-class ShotPlanResponse(BaseModel):
+
+class ShotPlanResponse(_ResponseModel):
     name: str
     clip_duration: float
     visual_prompt: str
@@ -109,23 +169,33 @@ class ShotPlanResponse(BaseModel):
 
     @classmethod
     def from_model(cls, model: ShotPlan) -> "ShotPlanResponse":
-        return cls(
+        return cls.construct(
             name=model.name,
             clip_duration=model.clip_duration,
             visual_prompt=model.visual_prompt,
             narration_text=model.narration_text,
             notes=model.notes,
-            metadata=model.metadata,
-            assets=[AssetPlanResponse.from_model(asset) for asset in model.assets],
-            tts_chunks=[TTSChunkResponse.from_model(chunk) for chunk in model.tts_chunks],
-            ken_burns_segments=[
-                KenBurnsSegmentResponse.from_model(segment)
-                for segment in model.ken_burns_segments
-            ],
-            inserted_clips=[
-                VideoClipReferenceResponse.from_model(clip)
-                for clip in model.inserted_clips
-            ],
+            metadata=dict(model.metadata),
+            assets=(
+                [AssetPlanResponse.from_model(asset) for asset in model.assets]
+                if model.assets
+                else []
+            ),
+            tts_chunks=(
+                [TTSChunkResponse.from_model(chunk) for chunk in model.tts_chunks]
+                if model.tts_chunks
+                else []
+            ),
+            ken_burns_segments=(
+                [KenBurnsSegmentResponse.from_model(segment) for segment in model.ken_burns_segments]
+                if model.ken_burns_segments
+                else []
+            ),
+            inserted_clips=(
+                [VideoClipReferenceResponse.from_model(clip) for clip in model.inserted_clips]
+                if model.inserted_clips
+                else []
+            ),
             audio_track=(
                 AssetPlanResponse.from_model(model.audio_track)
                 if model.audio_track
@@ -141,7 +211,7 @@ class ShotPlanResponse(BaseModel):
         )
 
 
-class ScenePlanResponse(BaseModel):
+class ScenePlanResponse(_ResponseModel):
     name: str
     summary: str
     metadata: dict[str, str] = Field(default_factory=dict)
@@ -158,10 +228,10 @@ class ScenePlanResponse(BaseModel):
             if model.background_audio
             else None
         )
-        return cls(
+        return cls.construct(
             name=model.name,
             summary=model.summary,
-            metadata=model.metadata,
+            metadata=dict(model.metadata),
             shots=[ShotPlanResponse.from_model(shot) for shot in model.shots],
             background_audio=background_audio,
             total_duration=model.total_duration,
@@ -170,7 +240,7 @@ class ScenePlanResponse(BaseModel):
         )
 
 
-class GenerateScriptResponse(BaseModel):
+class GenerateScriptResponse(_ResponseModel):
     scenes: List[ScenePlanResponse]
 
 
@@ -178,6 +248,11 @@ controller = StoryPipelineController(logger=logger)
 media_builder = KenBurnsFilmBuilder(media_root=Path("media"), logger=logger)
 
 
+_PLAN_RESPONSE_CACHE_SIZE = 64
+_plan_response_cache: "OrderedDict[Hashable, List[ScenePlanResponse]]" = OrderedDict()
+_plan_response_lock = threading.Lock()
+
+
 class ImageAssetInput(BaseModel):
     asset_identifier: str
     path: str
@@ -201,7 +276,7 @@ class RenderFilmRequest(BaseModel):
     image_style: str | None = None
 
 
-class RenderFilmResponse(BaseModel):
+class RenderFilmResponse(_ResponseModel):
     film_path: str
     shots: Dict[str, str]
     plan: GenerateScriptResponse
@@ -211,22 +286,85 @@ class RenderFilmResponse(BaseModel):
 def _group_supplemental_clips(
     inputs: List[SupplementalClipInput],
 ) -> Dict[str, List[VideoClipReference]]:
-    grouped: Dict[str, List[VideoClipReference]] = {}
-    counters: Dict[str, int] = {}
+    grouped: Dict[str, List[VideoClipReference]] = defaultdict(list)
     for clip in inputs:
-        counters.setdefault(clip.shot_name, 0)
-        counters[clip.shot_name] += 1
-        identifier = f"{clip.shot_name}-supplemental-{counters[clip.shot_name]}"
-        grouped.setdefault(clip.shot_name, []).append(
+        shot_clips = grouped[clip.shot_name]
+        shot_clips.append(
             VideoClipReference(
-                identifier=identifier,
+                identifier=f"{clip.shot_name}-supplemental-{len(shot_clips) + 1}",
                 source_uri=clip.source_uri,
                 duration=clip.duration,
                 insertion_offset=clip.insertion_offset,
                 description=clip.description,
             )
         )
-    return grouped
+    return dict(grouped)
+
+
+def _resolve_image_assets(inputs: List[ImageAssetInput]) -> Dict[str, str]:
+    """Map asset identifiers to image paths, reporting every missing file at once."""
+    image_assets: Dict[str, str] = {}
+    missing: List[str] = []
+    for asset in inputs:
+        asset_path = Path(asset.path)
+        if not asset_path.exists():
+            missing.append(asset.path)
+            continue
+        image_assets[asset.asset_identifier] = str(asset_path)
+
+    if missing:
+        raise HTTPException(
+            status_code=400,
+            detail="Image assets could not be found: "
+            + ", ".join(f"'{path}'" for path in missing),
+        )
+    return image_assets
+
+
+def _plan_cache_key(
+    story_text: str,
+    voice: str | None = None,
+    image_style: str | None = None,
+    supplemental_clips: Sequence[SupplementalClipInput] = (),
+) -> Hashable:
+    """Key identifying every input that shapes the generated scene plan.
+
+    The controller's own settings are part of the key, so reassigning a default
+    (voice, pacing or prompt style) never serves plans built under the old one.
+    """
+    return (
+        controller.default_voice,
+        controller.words_per_second,
+        controller.minimum_segment_duration,
+        controller.prompt_generator.default_style,
+        story_text,
+        voice or None,
+        image_style or None,
+        tuple(
+            (clip.shot_name, clip.source_uri, clip.duration, clip.insertion_offset, clip.description)
+            for clip in supplemental_clips
+        ),
+    )
+
+
+def _scene_responses(cache_key: Hashable, scenes: Sequence[ScenePlan]) -> List[ScenePlanResponse]:
+    """Convert scenes to response models, reusing the result for identical plans.
+
+    Planning is deterministic for a given cache key, so repeated renders of the
+    same story (for example with different image assets) skip the conversion.
+    """
+    with _plan_response_lock:
+        cached = _plan_response_cache.get(cache_key)
+        if cached is not None:
+            _plan_response_cache.move_to_end(cache_key)
+            return cached
+
+    responses = [ScenePlanResponse.from_model(scene) for scene in scenes]
+    with _plan_response_lock:
+        _plan_response_cache[cache_key] = responses
+        if len(_plan_response_cache) > _PLAN_RESPONSE_CACHE_SIZE:
+            _plan_response_cache.popitem(last=False)
+    return responses
 
 
 @app.get("/health")
@@ -235,31 +373,47 @@ def health_check() -> dict[str, str]:
     return {"status": "ok"}
 
 
-@app.post("/api/scripts/generate", response_model=GenerateScriptResponse)
-def generate_script(payload: GenerateScriptRequest) -> GenerateScriptResponse:
+# The route returns a prebuilt response so FastAPI neither re-validates the
+# constructed tree against a response_model nor walks it with jsonable_encoder;
+# the schema is still published for the docs through ``responses``.
+@app.post(
+    "/api/scripts/generate",
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={200: {"model": GenerateScriptResponse}},
+)
+async def generate_script(payload: GenerateScriptRequest) -> ORJSONResponse:
     story_text = payload.story_text.strip()
     if not story_text:
         raise HTTPException(status_code=400, detail="story_text must not be empty")
 
+    return await asyncio.to_thread(_generate_script_response, story_text)
+
+
+def _generate_script_response(story_text: str) -> ORJSONResponse:
+    """Plan, convert and encode a script in one worker-thread hop.
+
+    ``ORJSONResponse`` encodes its content on construction, so planning,
+    conversion and serialisation all stay off the event loop and large stories
+    never stall health checks or concurrent render streams.
+    """
     scenes = controller.plan_and_schedule(story_text)
-    response_scenes = [ScenePlanResponse.from_model(scene) for scene in scenes]
-    return GenerateScriptResponse(scenes=response_scenes)
+    response_scenes = _scene_responses(_plan_cache_key(story_text), scenes)
+    return ORJSONResponse(GenerateScriptResponse.construct(scenes=response_scenes).dict())
+
 
+@app.post("/api/films/render", response_class=StreamingResponse)
+async def render_film(payload: RenderFilmRequest) -> StreamingResponse:
+    """Plan and render a film, streaming progress as server-sent events.
 
-@app.post("/api/films/render", response_model=RenderFilmResponse)
-def render_film(payload: RenderFilmRequest) -> RenderFilmResponse:
+    Validation problems are still reported as plain HTTP errors. Once rendering
+    starts the stream emits a ``plan`` event, one ``shot`` event per rendered
+    shot, and finally either ``complete`` (a ``RenderFilmResponse``) or ``error``.
+    """
     story_text = payload.story_text.strip()
     if not story_text:
         raise HTTPException(status_code=400, detail="story_text must not be empty")
-    image_assets: Dict[str, str] = {}
-    for asset in payload.image_assets:
-        asset_path = Path(asset.path)
-        if not asset_path.exists():
-            raise HTTPException(
-                status_code=400,
-                detail=f"Image asset '{asset.path}' could not be found",
-            )
-        image_assets[asset.asset_identifier] = str(asset_path)
+    image_assets = await asyncio.to_thread(_resolve_image_assets, payload.image_assets)
 
     if not image_assets and not payload.auto_generate_images:
         raise HTTPException(
@@ -268,22 +422,8 @@ def render_film(payload: RenderFilmRequest) -> RenderFilmResponse:
         )
 
     clip_inputs = _group_supplemental_clips(payload.supplemental_clips)
-
-    original_voice = controller.default_voice
-    original_style = controller.prompt_generator.default_style
-    if payload.voice:
-        controller.default_voice = payload.voice
-    if payload.image_style:
-        controller.prompt_generator.default_style = payload.image_style
-
-    try:
-        scenes = controller.plan_and_schedule(story_text, inserted_clips=clip_inputs)
-    finally:
-        controller.default_voice = original_voice
-        controller.prompt_generator.default_style = original_style
-
-    plan_response = GenerateScriptResponse(
-        scenes=[ScenePlanResponse.from_model(scene) for scene in scenes]
+    scenes, plan_payload, plan_event = await asyncio.to_thread(
+        _plan_film, payload, story_text, clip_inputs
     )
 
     supplemental_map: Dict[str, List[VideoClipReference]] = {}
@@ -292,35 +432,124 @@ def render_film(payload: RenderFilmRequest) -> RenderFilmResponse:
             if shot.inserted_clips:
                 supplemental_map[shot.name] = shot.inserted_clips
 
-    try:
-        film_outputs = media_builder.build(
+    return StreamingResponse(
+        _render_events(payload, scenes, image_assets, supplemental_map, plan_payload, plan_event),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+def _plan_film(
+    payload: RenderFilmRequest,
+    story_text: str,
+    clip_inputs: Dict[str, List[VideoClipReference]],
+) -> tuple[Sequence[ScenePlan], Dict[str, Any], str]:
+    """Plan a render and encode its ``plan`` event in one worker-thread hop.
+
+    The plain payload is returned too, so the ``complete`` event can embed it
+    without walking the response models a second time.
+    """
+    scenes = controller.plan_and_schedule(
+        story_text,
+        inserted_clips=clip_inputs,
+        voice=payload.voice,
+        prompt_style=payload.image_style,
+    )
+    cache_key = _plan_cache_key(
+        story_text,
+        voice=payload.voice,
+        image_style=payload.image_style,
+        supplemental_clips=payload.supplemental_clips,
+    )
+    plan_payload = GenerateScriptResponse.construct(
+        scenes=_scene_responses(cache_key, scenes)
+    ).dict()
+    return scenes, plan_payload, _sse_event("plan", plan_payload)
+
+
+def _complete_event(film_outputs: Dict[str, Any], plan_payload: Dict[str, Any]) -> str:
+    # Keys mirror RenderFilmResponse.dict(); building the dict directly reuses the
+    # already-converted plan instead of re-serialising the response models.
+    return _sse_event(
+        "complete",
+        {
+            "film_path": str(film_outputs["film"]),
+            "shots": {
+                shot_name: str(path) for shot_name, path in film_outputs["shots"].items()
+            },
+            "plan": plan_payload,
+            "generated_images": {
+                identifier: str(path)
+                for identifier, path in film_outputs.get("images", {}).items()
+            },
+        },
+    )
+
+
+def _sse_event(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {orjson.dumps(data).decode()}\n\n"
+
+
+async def _render_events(
+    payload: RenderFilmRequest,
+    scenes: Sequence[ScenePlan],
+    image_assets: Dict[str, str],
+    supplemental_map: Dict[str, List[VideoClipReference]],
+    plan_payload: Dict[str, Any],
+    plan_event: str,
+) -> AsyncIterator[str]:
+    yield plan_event
+
+    loop = asyncio.get_running_loop()
+    progress: "asyncio.Queue[Dict[str, str] | None]" = asyncio.Queue()
+
+    def on_shot_rendered(shot: ShotPlan, path: Path) -> None:
+        loop.call_soon_threadsafe(progress.put_nowait, {"shot": shot.name, "path": str(path)})
+
+    # Rendering blocks for a long time (TTS, moviepy, ffmpeg); run it off the event
+    # loop so health checks and plan requests keep being served meanwhile. Progress
+    # callbacks are queued before the completion sentinel, so no shot is dropped.
+    render = asyncio.ensure_future(
+        asyncio.to_thread(
+            media_builder.build,
             scenes,
             image_assets=image_assets,
             supplemental_clips=supplemental_map,
             film_name=payload.film_name or "ken_burns_feature.mp4",
             auto_generate_images=payload.auto_generate_images,
             image_style=payload.image_style,
+            on_shot_rendered=on_shot_rendered,
         )
-    except FileNotFoundError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:  # pragma: no cover - defensive runtime guard
-        logger.exception("Failed to render film")
-        raise HTTPException(status_code=500, detail="Failed to render film") from exc
-
-    film_path = film_outputs["film"]
-    shot_paths = {
-        shot_name: str(path)
-        for shot_name, path in film_outputs["shots"].items()
-    }
-
-    generated_images = {
-        identifier: str(path)
-        for identifier, path in film_outputs.get("images", {}).items()
-    }
-
-    return RenderFilmResponse(
-        film_path=str(film_path),
-        shots=shot_paths,
-        plan=plan_response,
-        generated_images=generated_images,
     )
+    render.add_done_callback(lambda _: progress.put_nowait(None))
+
+    result_retrieved = False
+    try:
+        while (shot_event := await progress.get()) is not None:
+            yield _sse_event("shot", shot_event)
+
+        result_retrieved = True
+        try:
+            film_outputs = render.result()
+        except FileNotFoundError as exc:
+            yield _sse_event("error", {"status_code": 400, "detail": str(exc)})
+            return
+        except Exception:  # pragma: no cover - defensive runtime guard
+            logger.exception("Failed to render film")
+            yield _sse_event("error", {"status_code": 500, "detail": "Failed to render film"})
+            return
+
+        yield await asyncio.to_thread(_complete_event, film_outputs, plan_payload)
+    finally:
+        if not result_retrieved:
+            # The client went away mid-stream; the render thread keeps going, so
+            # retrieve and log its outcome once it finishes.
+            render.add_done_callback(_log_abandoned_render)
+
+
+def _log_abandoned_render(render: "asyncio.Future[Any]") -> None:
+    if render.cancelled():
+        return
+    exc = render.exception()
+    if exc is not None:
+        logger.error("Failed to render film", exc_info=exc)
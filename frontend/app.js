@@ -370,8 +370,27 @@ async function handleRender() {
       throw new Error(message);
     }
 
-    const data = await response.json();
-    renderScenes(data.plan.scenes);
+    let renderedShots = 0;
+    let totalShots = 0;
+    let data = null;
+    await readEventStream(response, (event, eventData) => {
+      if (event === "plan") {
+        renderScenes(eventData.scenes);
+        totalShots = eventData.scenes.reduce((count, scene) => count + scene.shots.length, 0);
+        formElements.filmStatus.textContent = `Rendering film... (0/${totalShots} shots)`;
+      } else if (event === "shot") {
+        renderedShots += 1;
+        formElements.filmStatus.textContent = `Rendering film... (${renderedShots}/${totalShots} shots, last: ${eventData.shot})`;
+      } else if (event === "complete") {
+        data = eventData;
+      } else if (event === "error") {
+        throw new Error(eventData.detail || "Failed to render film.");
+      }
+    });
+
+    if (!data) {
+      throw new Error("Render stream ended before the film was completed.");
+    }
     renderFilmOutputs(data.film_path, data.shots, data.generated_images);
     formElements.filmStatus.textContent = "Film rendered successfully.";
   } catch (error) {
@@ -388,6 +407,42 @@ async function handleRender() {
   }
 }
 
+async function readEventStream(response, onEvent) {
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+
+  const dispatch = (block) => {
+    let event = "message";
+    const dataLines = [];
+    block.split("\n").forEach((line) => {
+      if (line.startsWith("event:")) {
+        event = line.slice(6).trim();
+      } else if (line.startsWith("data:")) {
+        dataLines.push(line.slice(5).trimStart());
+      }
+    });
+    if (dataLines.length) {
+      onEvent(event, JSON.parse(dataLines.join("\n")));
+    }
+  };
+
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    let boundary = buffer.indexOf("\n\n");
+    while (boundary !== -1) {
+      dispatch(buffer.slice(0, boundary));
+      buffer = buffer.slice(boundary + 2);
+      boundary = buffer.indexOf("\n\n");
+    }
+  }
+  if (buffer.trim()) {
+    dispatch(buffer);
+  }
+}
+
 function renderFilmOutputs(filmPath, shotPaths, generatedImages) {
   if (!filmPath) {
     formElements.filmOutput.hidden = true;
@@ -1,12 +1,17 @@
 """Placeholder image generation helpers for Ken Burns renders."""
 from __future__ import annotations
 
+import hashlib
 import math
+import os
+import re
 import textwrap
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, Iterable, Tuple
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 from .models import AssetPlan
@@ -38,29 +43,53 @@ _STYLE_PRESETS: Dict[str, PlaceholderStyle] = {
 }
 
 
+# Part of every frame's cache key; bump it whenever the drawing code changes so
+# frames rendered by an older version are never served again.
+_FRAME_VERSION = "1"
+_FRAME_NAME = re.compile(r"[0-9a-f]{32}\.png")
+
+
+@lru_cache(maxsize=32)
+def _resolve_style(style_hint: str) -> PlaceholderStyle:
+    return _STYLE_PRESETS.get(style_hint) or _STYLE_PRESETS["cinematic realism"]
+
+
 class PlaceholderImageFactory:
     """Creates stylised frames when bespoke artwork is unavailable."""
 
-    def __init__(self, output_dir: Path) -> None:
+    def __init__(self, output_dir: Path, max_cached_frames: int = 512) -> None:
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.max_cached_frames = max_cached_frames
 
     def create(self, asset: AssetPlan, *, style_hint: str | None = None) -> Path:
-        """Generate a placeholder image for the provided asset plan."""
-        style = _STYLE_PRESETS.get(style_hint or asset.metadata.get("style", ""))
-        if style is None:
-            style = _STYLE_PRESETS["cinematic realism"]
-
-        file_name = f"{asset.identifier.replace(' ', '_')}.png"
-        path = self.output_dir / file_name
-        prompt = asset.metadata.get("prompt") or asset.description
-        keywords = asset.metadata.get("keywords", "")
-        mood = asset.metadata.get("mood", "Cinematic")
-
-        image = Image.new("RGB", (1920, 1080), color=style.background)
+        """Generate a placeholder image for the provided asset plan.
+
+        Frames are named after a digest of everything drawn on them, so repeated
+        prompts (across shots or render requests) reuse the existing file. Call
+        ``prune`` to bound how many such frames accumulate on disk.
+        """
+        metadata = asset.metadata
+        style = _resolve_style(style_hint or metadata.get("style", ""))
+
+        prompt = metadata.get("prompt") or asset.description
+        keywords = metadata.get("keywords", "")
+        mood = metadata.get("mood", "Cinematic")
+
+        cache_key = hashlib.blake2b(
+            f"{_FRAME_VERSION}|{prompt}|{keywords}|{mood}|{style.background}|{style.accent}|{style.text}|{style.font_size}".encode(),
+            digest_size=16,
+        ).hexdigest()
+        path = self.output_dir / f"{cache_key}.png"
+        if path.exists():
+            # Refresh the modification time so prune() treats the frame as recent.
+            os.utime(path)
+            asset.source_uri = str(path)
+            return path
+
+        image = self._render_gradient((1920, 1080), style)
         draw = ImageDraw.Draw(image)
-
-        self._draw_gradient(draw, image.size, style)
+        self._draw_accent_ring(draw, image.size, style)
 
         title_font = self._load_font(style.font_size)
         subtitle_font = self._load_font(int(style.font_size * 0.5))
@@ -71,22 +100,50 @@ class PlaceholderImageFactory:
         keyword_text = f"Mood: {mood}\nKeywords: {keywords}" if keywords else f"Mood: {mood}"
         draw.text((120, 720), textwrap.fill(keyword_text, width=40), font=subtitle_font, fill=style.text)
 
-        image.save(path)
+        # Write then rename so concurrent workers never expose a half-written frame.
+        partial_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp.png")
+        image.save(partial_path)
+        os.replace(partial_path, path)
         asset.source_uri = str(path)
         return path
 
-    def _draw_gradient(
+    def prune(self, keep: Iterable[Path] = ()) -> int:
+        """Delete the least recently used cached frames beyond ``max_cached_frames``.
+
+        Frames in ``keep`` are never removed. Returns the number of files deleted.
+        """
+        kept = {Path(path).name for path in keep}
+        frames = []
+        for entry in os.scandir(self.output_dir):
+            if _FRAME_NAME.fullmatch(entry.name) and entry.name not in kept:
+                try:
+                    frames.append((entry.stat().st_mtime_ns, entry.path))
+                except FileNotFoundError:
+                    continue
+        excess = len(frames) + len(kept) - self.max_cached_frames
+        if excess <= 0:
+            return 0
+        frames.sort()
+        for _, frame_path in frames[:excess]:
+            Path(frame_path).unlink(missing_ok=True)
+        return min(excess, len(frames))
+
+    @staticmethod
+    def _render_gradient(size: Tuple[int, int], style: PlaceholderStyle) -> Image.Image:
+        _, height = size
+        # Blend every row colour in one vectorised pass, then stretch the
+        # single-pixel column horizontally instead of drawing line by line.
+        blend = (np.arange(height, dtype=np.float64) / height)[:, None]
+        background = np.asarray(style.background, dtype=np.float64)
+        accent = np.asarray(style.accent, dtype=np.float64)
+        rows = (background * (1 - blend) + accent * blend).astype(np.uint8)
+        column = Image.frombytes("RGB", (1, height), rows.tobytes())
+        return column.resize(size, Image.NEAREST)
+
+    def _draw_accent_ring(
         self, draw: ImageDraw.ImageDraw, size: Tuple[int, int], style: PlaceholderStyle
     ) -> None:
         width, height = size
-        for y in range(height):
-            blend = y / height
-            color = tuple(
-                int(style.background[i] * (1 - blend) + style.accent[i] * blend)
-                for i in range(3)
-            )
-            draw.line([(0, y), (width, y)], fill=color)
-
         circle_radius = int(math.hypot(width, height) * 0.1)
         center = (int(width * 0.85), int(height * 0.2))
         draw.ellipse(
@@ -98,7 +155,15 @@ class PlaceholderImageFactory:
             width=6,
         )
 
+    @classmethod
+    def preload_fonts(cls) -> None:
+        """Warm the font cache for every preset, e.g. in a fresh worker process."""
+        for style in _STYLE_PRESETS.values():
+            cls._load_font(style.font_size)
+            cls._load_font(int(style.font_size * 0.5))
+
     @staticmethod
+    @lru_cache(maxsize=32)
     def _load_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
         try:
             return ImageFont.truetype("DejaVuSans.ttf", size)
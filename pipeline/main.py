@@ -4,7 +4,8 @@ from __future__ import annotations
 import itertools
 import logging
 import re
-from typing import Callable, Iterable, List, Mapping, Sequence
+from functools import lru_cache
+from typing import Callable, Iterator, List, Mapping, Sequence
 
 from .models import (
     AssetPlan,
@@ -18,6 +19,30 @@ from .prompting import PromptDetails, PromptGenerator
 from .scheduler import PipelineScheduler, PipelineStage, StageTask
 
 _SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+")
+_NARRATION_CHUNK_WORDS = 40
+_PAN_DIRECTIONS = ("left_to_right", "right_to_left", "center_pull")
+_MUSIC_KEYWORDS = re.compile(r"music|song|melody")
+_CHARACTER_KEYWORDS = re.compile(r"character|hero|villain")
+
+_IMAGE_PROMPT = "image_prompt"
+_VOICEOVER = "voiceover"
+_AUDIO = "audio"
+_CONCEPT_ART = "concept_art"
+_VISUAL_SUFFIX = "-visual"
+_VOICE_SUFFIX = "-voice"
+_MUSIC_SUFFIX = "-music"
+_CHARACTER_DESIGN_SUFFIX = "-character-design"
+
+
+@lru_cache(maxsize=4096)
+def _estimate_duration(
+    text: str, words_per_second: float, minimum_duration: float
+) -> float:
+    """Return the narration length for ``text``, cached for repeated lines."""
+    words = text.split()
+    if not words:
+        return 0.0
+    return max(minimum_duration, len(words) / words_per_second)
 
 
 class StoryPipelineController:
@@ -46,9 +71,16 @@ class StoryPipelineController:
         self,
         story_text: str,
         inserted_clips: Mapping[str, Sequence[VideoClipReference]] | None = None,
+        voice: str | None = None,
+        prompt_style: str | None = None,
     ) -> List[ScenePlan]:
-        """Convert free-form story text into structured scene plans."""
-        paragraphs = [paragraph.strip() for paragraph in story_text.split("\n\n") if paragraph.strip()]
+        """Convert free-form story text into structured scene plans.
+
+        ``voice`` and ``prompt_style`` override the controller defaults for this
+        call only, so concurrent requests never share per-request settings.
+        """
+        voice = voice or self.default_voice
+        paragraphs = [paragraph for paragraph in map(str.strip, story_text.split("\n\n")) if paragraph]
         scenes: List[ScenePlan] = []
         inserted_clips = inserted_clips or {}
 
@@ -66,15 +98,18 @@ class StoryPipelineController:
             )
 
             scene_elapsed = 0.0
+            scene_prefix = "Shot " + str(index) + "."
 
             for shot_number, sentence in enumerate(self._split_sentences(paragraph), start=1):
-                shot_name = f"Shot {index}.{shot_number}"
+                shot_name = scene_prefix + str(shot_number)
                 shot = self._build_shot_plan(
                     scene_index=index,
                     shot_index=shot_number,
                     sentence=sentence,
                     shot_name=shot_name,
                     supplemental_clips=inserted_clips.get(shot_name, ()),
+                    voice=voice,
+                    prompt_style=prompt_style,
                 )
 
                 scene.add_shot(shot)
@@ -107,10 +142,17 @@ class StoryPipelineController:
         self,
         story_text: str,
         inserted_clips: Mapping[str, Sequence[VideoClipReference]] | None = None,
+        voice: str | None = None,
+        prompt_style: str | None = None,
     ) -> Sequence[ScenePlan]:
         """Produce scene plans from text and enqueue all downstream tasks."""
         self.scheduler.clear()
-        scenes = self.ingest_story(story_text, inserted_clips=inserted_clips)
+        scenes = self.ingest_story(
+            story_text,
+            inserted_clips=inserted_clips,
+            voice=voice,
+            prompt_style=prompt_style,
+        )
         self.build_schedule(scenes)
         return scenes
 
@@ -119,53 +161,59 @@ class StoryPipelineController:
         self.scheduler.run(handler)
 
     @staticmethod
-    def _split_sentences(paragraph: str) -> List[str]:
-        sentences = [sentence.strip() for sentence in _SENTENCE_SPLIT_PATTERN.split(paragraph.strip()) if sentence.strip()]
-        return sentences
+    def _split_sentences(paragraph: str) -> Iterator[str]:
+        paragraph = paragraph.strip()
+        if not paragraph:
+            return
+
+        # Boundaries swallow all whitespace after terminal punctuation and the
+        # paragraph is already stripped, so every slice is trimmed and non-empty.
+        start = 0
+        for boundary in _SENTENCE_SPLIT_PATTERN.finditer(paragraph):
+            yield paragraph[start:boundary.start()]
+            start = boundary.end()
+        yield paragraph[start:]
 
     def _estimate_duration(self, text: str) -> float:
-        words = text.split()
-        if not words:
-            return 0.0
-        return max(self.minimum_segment_duration, len(words) / self.words_per_second)
+        return _estimate_duration(text, self.words_per_second, self.minimum_segment_duration)
 
     def _infer_assets_from_sentence(
         self, sentence: str, shot_name: str, prompt_details: PromptDetails
-    ) -> Iterable[AssetPlan]:
+    ) -> List[AssetPlan]:
         assets: List[AssetPlan] = []
         lower_sentence = sentence.lower()
 
         assets.append(
             AssetPlan(
-                identifier=f"{shot_name}-visual",
-                asset_type="image_prompt",
+                identifier=shot_name + _VISUAL_SUFFIX,
+                asset_type=_IMAGE_PROMPT,
                 description=f"Illustrate: {sentence}",
                 metadata=prompt_details.to_metadata(),
             )
         )
         assets.append(
             AssetPlan(
-                identifier=f"{shot_name}-voice",
-                asset_type="voiceover",
+                identifier=shot_name + _VOICE_SUFFIX,
+                asset_type=_VOICEOVER,
                 description="Narration track for the associated sentence.",
                 metadata={"script": sentence},
             )
         )
 
-        if any(keyword in lower_sentence for keyword in ("music", "song", "melody")):
+        if _MUSIC_KEYWORDS.search(lower_sentence):
             assets.append(
                 AssetPlan(
-                    identifier=f"{shot_name}-music",
-                    asset_type="audio",
+                    identifier=shot_name + _MUSIC_SUFFIX,
+                    asset_type=_AUDIO,
                     description="Background music inspired by the sentence mood.",
                 )
             )
 
-        if any(keyword in lower_sentence for keyword in ("character", "hero", "villain")):
+        if _CHARACTER_KEYWORDS.search(lower_sentence):
             assets.append(
                 AssetPlan(
-                    identifier=f"{shot_name}-character-design",
-                    asset_type="concept_art",
+                    identifier=shot_name + _CHARACTER_DESIGN_SUFFIX,
+                    asset_type=_CONCEPT_ART,
                     description="Character concept reference derived from the sentence.",
                 )
             )
@@ -179,8 +227,11 @@ class StoryPipelineController:
         sentence: str,
         shot_name: str,
         supplemental_clips: Sequence[VideoClipReference],
+        voice: str | None = None,
+        prompt_style: str | None = None,
     ) -> ShotPlan:
-        narration_chunks = self._chunk_narration(sentence, shot_name)
+        voice = voice or self.default_voice
+        narration_chunks = self._chunk_narration(sentence, shot_name, voice=voice)
         ken_burns_segments = self._plan_ken_burns_segments(shot_name, narration_chunks)
         clip_duration = sum(segment.duration for segment in ken_burns_segments)
         if supplemental_clips:
@@ -188,7 +239,7 @@ class StoryPipelineController:
 
         clip_duration = max(clip_duration, self._estimate_duration(sentence))
 
-        prompt_details = self.prompt_generator.build_prompt(sentence)
+        prompt_details = self.prompt_generator.build_prompt(sentence, style=prompt_style)
         prompt_keywords = prompt_details.keywords
 
         shot = ShotPlan(
@@ -196,32 +247,29 @@ class StoryPipelineController:
             clip_duration=clip_duration,
             visual_prompt=sentence,
             narration_text=sentence,
-            metadata={"keywords": ", ".join(prompt_keywords)},
-        )
-
-        shot.metadata.update(
-            {
+            metadata={
+                "keywords": ", ".join(prompt_keywords),
                 "word_count": str(len(sentence.split())),
                 "estimated_duration": f"{clip_duration:.2f}",
-            }
+            },
+            tts_chunks=narration_chunks,
+            ken_burns_segments=ken_burns_segments,
         )
 
-        for asset in self._infer_assets_from_sentence(sentence, shot_name, prompt_details):
-            shot.add_asset(asset)
-
-        for chunk in narration_chunks:
-            shot.add_tts_chunk(chunk)
-            shot.add_asset(
-                AssetPlan(
-                    identifier=f"{chunk.identifier}-audio",
-                    asset_type="tts_chunk",
-                    description=f"Synthesised narration chunk {chunk.chunk_index} for {shot_name}",
-                    duration=chunk.duration,
-                    start_time=chunk.start_offset,
-                    end_time=chunk.end_offset,
-                    metadata={"voice": chunk.voice, "text": chunk.text},
-                )
+        # Bulk-extend the fresh asset list rather than dispatching add_asset per item.
+        shot.assets.extend(self._infer_assets_from_sentence(sentence, shot_name, prompt_details))
+        shot.assets.extend(
+            AssetPlan(
+                identifier=f"{chunk.identifier}-audio",
+                asset_type="tts_chunk",
+                description=f"Synthesised narration chunk {chunk.chunk_index} for {shot_name}",
+                duration=chunk.duration,
+                start_time=chunk.start_offset,
+                end_time=chunk.end_offset,
+                metadata={"voice": chunk.voice, "text": chunk.text},
             )
+            for chunk in narration_chunks
+        )
 
         shot_audio_duration = narration_chunks[-1].end_offset if narration_chunks else 0.0
         effective_audio_duration = max(shot_audio_duration, clip_duration)
@@ -231,14 +279,11 @@ class StoryPipelineController:
             description=f"Compiled narration for {shot_name}",
             duration=effective_audio_duration,
             metadata={
-                "voice": self.default_voice,
+                "voice": voice,
                 "narration_duration": f"{shot_audio_duration:.2f}",
             },
         )
 
-        for segment in ken_burns_segments:
-            shot.add_ken_burns_segment(segment)
-
         for idx, clip in enumerate(supplemental_clips, start=1):
             clip_identifier = f"{shot_name}-clip-{idx}"
             reference = VideoClipReference(
@@ -270,51 +315,37 @@ class StoryPipelineController:
 
         return shot
 
-    def _chunk_narration(self, text: str, shot_name: str) -> List[TTSChunk]:
+    def _chunk_narration(
+        self, text: str, shot_name: str, voice: str | None = None
+    ) -> List[TTSChunk]:
         if not text:
             return []
 
+        voice = voice or self.default_voice
         words = text.split()
-        chunk_words: List[str] = []
-        chunk_index = 0
-        chunks: List[TTSChunk] = []
-        start_offset = 0.0
-
-        for word in words:
-            chunk_words.append(word)
-            if len(chunk_words) >= 40:
-                chunk_index += 1
-                chunk_text = " ".join(chunk_words)
-                duration = max(self.minimum_segment_duration, len(chunk_words) / self.words_per_second)
-                chunks.append(
-                    TTSChunk(
-                        identifier=f"{shot_name}-tts-{chunk_index}",
-                        text=chunk_text,
-                        chunk_index=chunk_index,
-                        start_offset=start_offset,
-                        duration=duration,
-                        voice=self.default_voice,
-                    )
-                )
-                start_offset += duration
-                chunk_words = []
-
-        if chunk_words:
-            chunk_index += 1
-            chunk_text = " ".join(chunk_words)
-            duration = max(self.minimum_segment_duration, len(chunk_words) / self.words_per_second)
-            chunks.append(
-                TTSChunk(
-                    identifier=f"{shot_name}-tts-{chunk_index}",
-                    text=chunk_text,
-                    chunk_index=chunk_index,
-                    start_offset=start_offset,
-                    duration=duration,
-                    voice=self.default_voice,
-                )
+        chunk_words = [
+            words[start:start + _NARRATION_CHUNK_WORDS]
+            for start in range(0, len(words), _NARRATION_CHUNK_WORDS)
+        ]
+        durations = [
+            max(self.minimum_segment_duration, len(chunk) / self.words_per_second)
+            for chunk in chunk_words
+        ]
+        start_offsets = itertools.accumulate(durations, initial=0.0)
+
+        return [
+            TTSChunk(
+                identifier=f"{shot_name}-tts-{chunk_index}",
+                text=" ".join(chunk),
+                chunk_index=chunk_index,
+                start_offset=start_offset,
+                duration=duration,
+                voice=voice,
             )
-
-        return chunks
+            for chunk_index, (chunk, duration, start_offset) in enumerate(
+                zip(chunk_words, durations, start_offsets), start=1
+            )
+        ]
 
     def _plan_ken_burns_segments(
         self, shot_name: str, chunks: Sequence[TTSChunk]
@@ -322,16 +353,16 @@ class StoryPipelineController:
         if not chunks:
             return []
 
-        directions = itertools.cycle(["left_to_right", "right_to_left", "center_pull"])
         segments: List[KenBurnsSegment] = []
         current_offset = 0.0
+        asset_identifier = shot_name + _VISUAL_SUFFIX
 
-        for chunk in chunks:
+        for position, chunk in enumerate(chunks):
             duration = max(self.minimum_segment_duration, chunk.duration)
-            direction = next(directions)
+            direction = _PAN_DIRECTIONS[position % len(_PAN_DIRECTIONS)]
             segment = KenBurnsSegment(
                 identifier=f"{shot_name}-kb-{chunk.chunk_index}",
-                asset_identifier=f"{shot_name}-visual",
+                asset_identifier=asset_identifier,
                 duration=duration,
                 zoom_start=1.0,
                 zoom_end=1.1 if direction != "center_pull" else 1.2,
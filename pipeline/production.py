@@ -1,9 +1,15 @@
 """Media production utilities for assembling Ken Burns style films."""
 from __future__ import annotations
 
+import bisect
+import itertools
 import logging
+import multiprocessing
+import os
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Mapping, MutableMapping, Sequence
+from typing import Callable, Dict, Iterator, List, Mapping, MutableMapping, Sequence
 
 from moviepy.editor import (
     AudioFileClip,
@@ -12,12 +18,86 @@ from moviepy.editor import (
     VideoFileClip,
     concatenate_videoclips,
 )
+from moviepy.config import get_setting
 from moviepy.video.fx import all as vfx
-from pydub import AudioSegment
 import pyttsx3
 
 from .imagery import PlaceholderImageFactory
-from .models import KenBurnsSegment, ScenePlan, ShotPlan, TTSChunk, VideoClipReference
+from .models import AssetPlan, KenBurnsSegment, ScenePlan, ShotPlan, TTSChunk, VideoClipReference
+
+
+def _process_pool(
+    max_workers: int,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple = (),
+) -> ProcessPoolExecutor:
+    """Create a worker pool for CPU-bound rendering.
+
+    Where available, workers are forked from a single-threaded forkserver that
+    has already imported this module, so they start quickly and never inherit
+    locks held by the threads of a running web server. Platforms without
+    forkserver (Windows) fall back to spawn, which is equally thread-safe.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload([__name__])
+    else:
+        context = multiprocessing.get_context("spawn")
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=context,
+        initializer=initializer,
+        initargs=initargs,
+    )
+
+
+def _render_shot(
+    tts: TTSAudioAssembler,
+    renderer: KenBurnsRenderer,
+    shot: ShotPlan,
+    image_assets: Mapping[str, str],
+    shot_dir: Path,
+    supplemental_clips: Sequence[VideoClipReference],
+) -> tuple[Path | None, Path]:
+    """Synthesise narration and render the Ken Burns clip for a single shot."""
+    audio_path = None
+    if shot.tts_chunks:
+        tts._logger.debug("Synthesising audio for shot %s", shot.name)
+        audio_path = tts.synthesise_shot(shot, shot_dir / "audio")
+    if shot.audio_track is None:
+        raise ValueError(f"Shot '{shot.name}' lacks an audio track plan")
+
+    renderer._logger.debug("Rendering Ken Burns clip for %s", shot.name)
+    video_path = renderer.render_shot(
+        shot,
+        image_assets=image_assets,
+        output_dir=shot_dir / "video",
+        supplemental_clips=supplemental_clips,
+    )
+    return audio_path, video_path
+
+
+# Per-process copies of the builder's narration and rendering helpers, installed
+# by _init_shot_worker so pyttsx3 engines are only ever created inside a worker.
+_worker_tts: TTSAudioAssembler | None = None
+_worker_renderer: KenBurnsRenderer | None = None
+
+
+def _init_shot_worker(tts: TTSAudioAssembler, renderer: KenBurnsRenderer) -> None:
+    global _worker_tts, _worker_renderer
+    _worker_tts = tts
+    _worker_renderer = renderer
+
+
+def _render_shot_in_worker(
+    shot: ShotPlan,
+    image_assets: Mapping[str, str],
+    shot_dir: Path,
+    supplemental_clips: Sequence[VideoClipReference],
+) -> tuple[Path | None, Path]:
+    return _render_shot(
+        _worker_tts, _worker_renderer, shot, image_assets, shot_dir, supplemental_clips
+    )
 
 
 class TTSAudioAssembler:
@@ -25,6 +105,35 @@ class TTSAudioAssembler:
 
     def __init__(self, logger: logging.Logger | None = None) -> None:
         self._logger = logger or logging.getLogger(self.__class__.__name__)
+        self._engine: pyttsx3.Engine | None = None
+        self._engine_voice: str | None = None
+        self._default_voice: str | None = None
+
+    def __getstate__(self) -> dict:
+        # Engines are bound to the process that created them; a copy sent to a
+        # worker process initialises its own on first use.
+        state = self.__dict__.copy()
+        state["_engine"] = None
+        state["_engine_voice"] = None
+        state["_default_voice"] = None
+        return state
+
+    def close(self) -> None:
+        """Release the speech engine; the next shot initialises a fresh one."""
+        if self._engine is not None:
+            self._engine.stop()
+        self._engine = None
+        self._engine_voice = None
+        self._default_voice = None
+
+    def _get_engine(self) -> pyttsx3.Engine:
+        if self._engine is None:
+            self._engine = pyttsx3.init()
+            # pyttsx3.init() hands back a cached engine while any reference to it
+            # survives, so remember its initial voice to restore after failures.
+            self._default_voice = self._engine.getProperty("voice")
+            self._engine_voice = self._default_voice
+        return self._engine
 
     def synthesise_shot(self, shot: ShotPlan, output_dir: Path) -> Path:
         """Generate a compiled narration WAV file for the provided shot."""
@@ -34,12 +143,18 @@ class TTSAudioAssembler:
         output_dir.mkdir(parents=True, exist_ok=True)
         chunk_paths = []
 
-        engine = pyttsx3.init()
-        if shot.tts_chunks and shot.tts_chunks[0].voice:
+        voice = shot.tts_chunks[0].voice
+        engine = self._get_engine()
+        if voice and voice != self._engine_voice:
             try:
-                engine.setProperty("voice", shot.tts_chunks[0].voice)
+                engine.setProperty("voice", voice)
+                self._engine_voice = voice
             except Exception as exc:  # pragma: no cover - defensive configuration guard
-                self._logger.warning("Unable to set voice '%s': %s", shot.tts_chunks[0].voice, exc)
+                self._logger.warning("Unable to set voice '%s': %s", voice, exc)
+                # Narrate with the engine's default voice, not the previous shot's.
+                if self._engine_voice != self._default_voice:
+                    engine.setProperty("voice", self._default_voice)
+                    self._engine_voice = self._default_voice
 
         for chunk in shot.tts_chunks:
             chunk_path = output_dir / f"{chunk.identifier}.wav"
@@ -49,25 +164,56 @@ class TTSAudioAssembler:
 
         engine.runAndWait()
 
-        combined = AudioSegment.silent(duration=0)
-        for path in chunk_paths:
-            self._logger.debug("Appending audio chunk %s", path)
-            chunk_audio = AudioSegment.from_file(path)
-            combined += chunk_audio
-
-        target_duration_ms = int(round(shot.clip_duration * 1000))
-        if target_duration_ms > len(combined):
-            padding = target_duration_ms - len(combined)
-            self._logger.debug("Padding narration with %sms of silence", padding)
-            combined += AudioSegment.silent(duration=padding)
-
         master_path = output_dir / f"{shot.audio_track.identifier}.wav"
-        combined.export(master_path, format="wav")
+        self._concatenate_chunks(chunk_paths, master_path, shot.clip_duration)
 
         shot.audio_track.source_uri = str(master_path)
         shot.audio_track.duration = shot.clip_duration
         return master_path
 
+    def _concatenate_chunks(
+        self, chunk_paths: Sequence[Path], master_path: Path, minimum_duration: float
+    ) -> None:
+        """Join chunk WAVs into ``master_path`` in one ffmpeg pass.
+
+        The concat demuxer streams each chunk once, and ``apad`` appends silence
+        until the track reaches ``minimum_duration`` seconds.
+        """
+        list_path = master_path.with_suffix(".concat.txt")
+        list_path.write_text(
+            "".join(
+                "file '" + str(path.resolve()).replace("'", "'\\''") + "'\n"
+                for path in chunk_paths
+            ),
+            encoding="utf-8",
+        )
+        self._logger.debug(
+            "Concatenating %d audio chunks into %s", len(chunk_paths), master_path
+        )
+        command = [
+            get_setting("FFMPEG_BINARY"),
+            "-y",
+            "-loglevel",
+            "error",
+            "-f",
+            "concat",
+            "-safe",
+            "0",
+            "-i",
+            str(list_path),
+            "-af",
+            f"apad=whole_dur={minimum_duration:.3f}",
+            str(master_path),
+        ]
+        try:
+            result = subprocess.run(command, capture_output=True, text=True)
+        finally:
+            list_path.unlink(missing_ok=True)
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"ffmpeg failed to assemble narration {master_path.name}: {result.stderr.strip()}"
+            )
+
 
 class KenBurnsRenderer:
     """Render Ken Burns movement clips and merge with inserted footage."""
@@ -109,13 +255,29 @@ class KenBurnsRenderer:
             clip = self._create_ken_burns_clip(Path(image_path), segment)
             clips.append(clip)
 
+        # Start time of each clip within the shot; non-decreasing, so insertion
+        # points can be found by bisection instead of re-summing durations.
+        clip_starts = list(
+            itertools.accumulate(
+                (getattr(clip, "duration", 0.0) for clip in clips), initial=0.0
+            )
+        )
+        total_duration = clip_starts.pop()
         for reference in supplemental_clips:
             clip_path = Path(reference.source_uri)
             if not clip_path.exists():
                 raise FileNotFoundError(f"Supplemental clip '{clip_path}' not found")
             self._logger.debug("Adding supplemental clip %s", clip_path)
             clip = VideoFileClip(str(clip_path)).subclip(0, reference.duration)
-            clips.insert(self._insertion_index_for(reference, clips), clip)
+            index = self._insertion_index_for(reference, clip_starts)
+            clips.insert(index, clip)
+
+            clip_duration = getattr(clip, "duration", 0.0)
+            start = clip_starts[index] if index < len(clip_starts) else total_duration
+            clip_starts[index:] = [start] + [
+                offset + clip_duration for offset in clip_starts[index:]
+            ]
+            total_duration += clip_duration
 
         final_clip = concatenate_videoclips(clips, method="compose")
 
@@ -166,14 +328,11 @@ class KenBurnsRenderer:
         return clip
 
     @staticmethod
-    def _insertion_index_for(reference: VideoClipReference, clips: Sequence) -> int:
-        elapsed = 0.0
-        for index, clip in enumerate(clips):
-            clip_duration = getattr(clip, "duration", 0.0)
-            if reference.insertion_offset <= elapsed:
-                return index
-            elapsed += clip_duration
-        return len(clips)
+    def _insertion_index_for(
+        reference: VideoClipReference, clip_starts: Sequence[float]
+    ) -> int:
+        """Return the first clip position starting at or after the reference offset."""
+        return bisect.bisect_left(clip_starts, reference.insertion_offset)
 
 
 class FilmAssembler:
@@ -225,6 +384,7 @@ class KenBurnsFilmBuilder:
         media_root: Path,
         logger: logging.Logger | None = None,
         placeholder_factory: PlaceholderImageFactory | None = None,
+        max_workers: int | None = None,
     ) -> None:
         self.media_root = media_root
         self.media_root.mkdir(parents=True, exist_ok=True)
@@ -235,6 +395,7 @@ class KenBurnsFilmBuilder:
         self.image_factory = placeholder_factory or PlaceholderImageFactory(
             self.media_root / "images"
         )
+        self.max_workers = max_workers or os.cpu_count() or 1
 
     def build(
         self,
@@ -244,7 +405,17 @@ class KenBurnsFilmBuilder:
         film_name: str = "ken_burns_feature.mp4",
         auto_generate_images: bool = False,
         image_style: str | None = None,
+        on_shot_rendered: Callable[[ShotPlan, Path], None] | None = None,
     ) -> MutableMapping[str, Path]:
+        """Render every shot and assemble the film.
+
+        ``on_shot_rendered`` is called with each shot and its video path as soon as
+        that shot finishes, so callers can report progress during long renders.
+
+        With more than one worker, shots render in separate processes started by
+        forkserver, or spawn where forkserver is unavailable (Windows). Scripts
+        calling this directly need an ``if __name__ == "__main__":`` guard there.
+        """
         supplemental_clips = supplemental_clips or {}
         image_assets_map: Dict[str, str] = dict(image_assets or {})
         generated_images: Dict[str, Path] = {}
@@ -258,30 +429,67 @@ class KenBurnsFilmBuilder:
             generated_images=generated_images,
         )
 
-        for scene in scenes:
-            for shot in scene.shots:
-                shot_dir = self.media_root / "shots" / shot.name.replace(" ", "_")
-                if shot.tts_chunks:
-                    self.logger.debug("Synthesising audio for shot %s", shot.name)
-                    self.tts.synthesise_shot(shot, shot_dir / "audio")
-                if shot.audio_track is None:
-                    raise ValueError(f"Shot '{shot.name}' lacks an audio track plan")
-
-                clip_references = supplemental_clips.get(shot.name, [])
-                self.logger.debug("Rendering Ken Burns clip for %s", shot.name)
-                video_path = self.renderer.render_shot(
-                    shot,
-                    image_assets=image_assets_map,
-                    output_dir=shot_dir / "video",
-                    supplemental_clips=clip_references,
-                )
-                shot_video_map[shot.name] = video_path
+        shot_jobs = [
+            (
+                shot,
+                self.media_root / "shots" / shot.name.replace(" ", "_"),
+                supplemental_clips.get(shot.name, []),
+            )
+            for scene in scenes
+            for shot in scene.shots
+        ]
+        for shot, video_path in self._render_shots(shot_jobs, image_assets_map):
+            shot_video_map[shot.name] = video_path
+            if on_shot_rendered is not None:
+                on_shot_rendered(shot, video_path)
 
         film_path = self.media_root / film_name
         self.logger.debug("Assembling final film %s", film_path)
         self.assembler.assemble(scenes, film_path, shot_video_map)
         return {"film": film_path, "shots": shot_video_map, "images": generated_images}
 
+    def close(self) -> None:
+        """Release the speech engine kept between builds."""
+        self.tts.close()
+
+    def _render_shots(
+        self,
+        shot_jobs: Sequence[tuple[ShotPlan, Path, Sequence[VideoClipReference]]],
+        image_assets: Mapping[str, str],
+    ) -> Iterator[tuple[ShotPlan, Path]]:
+        """Yield each shot with its rendered video, in story order."""
+        workers = min(len(shot_jobs), self.max_workers)
+        if workers <= 1:
+            for shot, shot_dir, clip_references in shot_jobs:
+                _, video_path = _render_shot(
+                    self.tts, self.renderer, shot, image_assets, shot_dir, clip_references
+                )
+                yield shot, video_path
+            return
+
+        # Shots are independent until final assembly. Workers render copies of the
+        # shots, so the resulting paths are written back onto the parent's plans.
+        self.logger.debug("Rendering %d shots across %d processes", len(shot_jobs), workers)
+        pool = _process_pool(
+            workers, initializer=_init_shot_worker, initargs=(self.tts, self.renderer)
+        )
+        try:
+            futures = [
+                pool.submit(
+                    _render_shot_in_worker, shot, image_assets, shot_dir, clip_references
+                )
+                for shot, shot_dir, clip_references in shot_jobs
+            ]
+            for (shot, _, _), future in zip(shot_jobs, futures):
+                audio_path, video_path = future.result()
+                if audio_path is not None:
+                    shot.audio_track.source_uri = str(audio_path)
+                    shot.audio_track.duration = shot.clip_duration
+                shot.assembled_video.source_uri = str(video_path)
+                yield shot, video_path
+        finally:
+            pool.shutdown(cancel_futures=True)
+
     def _ensure_images(
         self,
         scenes: Sequence[ScenePlan],
@@ -292,6 +500,7 @@ class KenBurnsFilmBuilder:
         generated_images: Dict[str, Path],
     ) -> None:
         missing: list[str] = []
+        pending: list[AssetPlan] = []
         for scene in scenes:
             for shot in scene.shots:
                 for asset in shot.assets:
@@ -307,13 +516,36 @@ class KenBurnsFilmBuilder:
                     self.logger.debug(
                         "Auto-generating placeholder image for %s", asset.identifier
                     )
-                    generated_path = self.image_factory.create(
-                        asset, style_hint=style_hint
-                    )
-                    image_assets[asset.identifier] = str(generated_path)
-                    generated_images[asset.identifier] = generated_path
+                    pending.append(asset)
 
         if missing:
             raise FileNotFoundError(
                 "Missing generated images for: " + ", ".join(sorted(set(missing)))
             )
+
+        generated_paths = self._create_placeholders(pending, style_hint)
+        for asset, generated_path in zip(pending, generated_paths):
+            asset.source_uri = str(generated_path)
+            image_assets[asset.identifier] = str(generated_path)
+            generated_images[asset.identifier] = generated_path
+        if generated_paths:
+            self.image_factory.prune(keep=generated_paths)
+
+    def _create_placeholders(
+        self, assets: Sequence[AssetPlan], style_hint: str | None
+    ) -> List[Path]:
+        workers = min(len(assets), self.max_workers)
+        if workers <= 1:
+            return [self.image_factory.create(asset, style_hint=style_hint) for asset in assets]
+
+        # Placeholder rendering is CPU-bound and independent per asset. Workers only
+        # return paths, so the caller records source_uri on the parent's assets.
+        self.logger.debug(
+            "Rendering %d placeholder images across %d processes", len(assets), workers
+        )
+        with _process_pool(workers, initializer=PlaceholderImageFactory.preload_fonts) as pool:
+            futures = [
+                pool.submit(self.image_factory.create, asset, style_hint=style_hint)
+                for asset in assets
+            ]
+            return [future.result() for future in futures]
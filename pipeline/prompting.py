@@ -6,53 +6,68 @@ from dataclasses import dataclass
 from typing import Dict, Iterable, List
 
 
-_STOPWORDS = {
-    "the",
-    "a",
-    "an",
-    "and",
-    "or",
-    "but",
-    "so",
-    "because",
-    "of",
-    "for",
-    "in",
-    "on",
-    "with",
-    "to",
-    "their",
-    "his",
-    "her",
-    "its",
-    "is",
-    "are",
-    "was",
-    "were",
-    "be",
-    "as",
-    "at",
-    "by",
-    "they",
-    "them",
-    "he",
-    "she",
-    "it",
-    "we",
-    "you",
-    "i",
-    "from",
-    "into",
-    "over",
-    "under",
-    "that",
-    "this",
-    "these",
-    "those",
-}
+_STOPWORDS: frozenset[str] = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "but",
+        "so",
+        "because",
+        "of",
+        "for",
+        "in",
+        "on",
+        "with",
+        "to",
+        "their",
+        "his",
+        "her",
+        "its",
+        "is",
+        "are",
+        "was",
+        "were",
+        "be",
+        "as",
+        "at",
+        "by",
+        "they",
+        "them",
+        "he",
+        "she",
+        "it",
+        "we",
+        "you",
+        "i",
+        "from",
+        "into",
+        "over",
+        "under",
+        "that",
+        "this",
+        "these",
+        "those",
+    }
+)
 
 _WORD_PATTERN = re.compile(r"[A-Za-z']+")
 
+# Trigger words per mood, in priority order: when keywords hit several groups
+# the earliest group wins, regardless of keyword order.
+_MOOD_GROUPS = (
+    ("moody cinematic", ("dark", "mysterious", "shadow", "midnight")),
+    ("warm and nostalgic", ("love", "warm", "sunset", "family")),
+    ("dramatic and intense", ("battle", "storm", "tension", "urgent")),
+    ("futuristic neon", ("future", "neon", "cyber", "tech")),
+)
+_MOOD_RANKS: Dict[str, int] = {
+    word: rank for rank, (_, words) in enumerate(_MOOD_GROUPS) for word in words
+}
+_DEFAULT_MOOD = "uplifting and hopeful"
+
 
 @dataclass(slots=True)
 class PromptDetails:
@@ -83,14 +98,31 @@ class PromptGenerator:
     def __init__(self, default_style: str = "cinematic realism") -> None:
         self.default_style = default_style
 
-    def build_prompt(self, sentence: str) -> PromptDetails:
-        """Create a prompt tuned for diffusion/vision models."""
+    @property
+    def default_style(self) -> str:
+        """Style applied when ``build_prompt`` is not given one."""
+        return self._default_style
+
+    @default_style.setter
+    def default_style(self, style: str) -> None:
+        self._default_style = style
+        self._style_title = style.title()
+
+    def build_prompt(self, sentence: str, style: str | None = None) -> PromptDetails:
+        """Create a prompt tuned for diffusion/vision models.
+
+        ``style`` overrides ``default_style`` for this prompt only.
+        """
+        if style:
+            style_title = style.title()
+        else:
+            style, style_title = self._default_style, self._style_title
         cleaned_sentence = " ".join(sentence.strip().split())
         keywords = self._extract_keywords(cleaned_sentence)
         mood = self._infer_mood(keywords)
 
         prompt = (
-            f"{cleaned_sentence}. {self.default_style.title()} lighting, {mood} mood,"
+            f"{cleaned_sentence}. {style_title} lighting, {mood} mood,"
             " ultra high definition, detailed textures, DSLR depth of field"
         )
         negative_prompt = (
@@ -101,30 +133,26 @@ class PromptGenerator:
             prompt=prompt,
             negative_prompt=negative_prompt,
             keywords=keywords,
-            style=self.default_style,
+            style=style,
             mood=mood,
         )
 
     def _extract_keywords(self, sentence: str) -> List[str]:
-        tokens = [word.lower() for word in _WORD_PATTERN.findall(sentence)]
-        keywords = [token for token in tokens if token not in _STOPWORDS]
-        unique: List[str] = []
-        for token in keywords:
-            if token not in unique:
-                unique.append(token)
-        return unique[:8]
+        if sentence.isascii():
+            tokens = _WORD_PATTERN.findall(sentence.lower())
+        else:
+            # Lowering first could turn non-ASCII letters (e.g. the Kelvin sign)
+            # into ASCII ones the pattern would then match.
+            tokens = [word.lower() for word in _WORD_PATTERN.findall(sentence)]
+        unique = dict.fromkeys(token for token in tokens if token not in _STOPWORDS)
+        return list(unique)[:8]
 
     def _infer_mood(self, keywords: Iterable[str]) -> str:
-        keyword_set = {word.lower() for word in keywords}
-        if keyword_set & {"dark", "mysterious", "shadow", "midnight"}:
-            return "moody cinematic"
-        if keyword_set & {"love", "warm", "sunset", "family"}:
-            return "warm and nostalgic"
-        if keyword_set & {"battle", "storm", "tension", "urgent"}:
-            return "dramatic and intense"
-        if keyword_set & {"future", "neon", "cyber", "tech"}:
-            return "futuristic neon"
-        return "uplifting and hopeful"
+        # Keywords arrive lowercased from _extract_keywords.
+        ranks = [_MOOD_RANKS[word] for word in keywords if word in _MOOD_RANKS]
+        if not ranks:
+            return _DEFAULT_MOOD
+        return _MOOD_GROUPS[min(ranks)][0]
 
 
 __all__ = ["PromptGenerator", "PromptDetails"]
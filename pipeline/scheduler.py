@@ -34,19 +34,29 @@ class StageTask:
 class PipelineScheduler:
     """Queue-based scheduler coordinating pipeline tasks."""
 
+    _STAGES: tuple[PipelineStage, ...] = tuple(PipelineStage)
+
     def __init__(self, logger: Optional[logging.Logger] = None) -> None:
         self._logger = logger or logging.getLogger(self.__class__.__name__)
         self._queue: Deque[StageTask] = deque()
 
     def enqueue(self, task: StageTask) -> None:
         """Add a task to the scheduler queue."""
-        self._logger.debug("Enqueuing task %s for scene=%s shot=%s", task.stage, task.scene.name, getattr(task.shot, "name", None))
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("Enqueuing task %s for scene=%s shot=%s", task.stage, task.scene.name, getattr(task.shot, "name", None))
         self._queue.append(task)
 
     def extend(self, tasks: Iterable[StageTask]) -> None:
-        """Add multiple tasks to the queue."""
-        for task in tasks:
-            self.enqueue(task)
+        """Add multiple tasks to the queue.
+
+        With debug logging disabled the tasks are appended in bulk and the
+        per-task "Enqueuing" lines are skipped.
+        """
+        if self._logger.isEnabledFor(logging.DEBUG):
+            for task in tasks:
+                self.enqueue(task)
+        else:
+            self._queue.extend(tasks)
 
     def schedule_scene(self, scene: ScenePlan) -> None:
         """Generate and queue tasks for each shot in the scene."""
@@ -54,18 +64,30 @@ class PipelineScheduler:
             self._logger.warning("Scene '%s' has no shots to schedule", scene.name)
             return
 
-        for shot in scene.shots:
-            for stage in PipelineStage:
-                self.enqueue(StageTask(stage=stage, scene=scene, shot=shot))
+        self._queue.extend(
+            StageTask(stage=stage, scene=scene, shot=shot)
+            for shot in scene.shots
+            for stage in self._STAGES
+        )
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "Enqueued %d tasks for scene=%s", len(scene.shots) * len(self._STAGES), scene.name
+            )
 
     def run(self, handler: Callable[[StageTask], None]) -> None:
         """Process tasks sequentially using the provided handler."""
-        while self._queue:
-            task = self._queue.popleft()
+        # Checked once per run; per-task progress lines are skipped entirely
+        # when INFO is disabled, which is the common case for large stories.
+        log_info = self._logger.info if self._logger.isEnabledFor(logging.INFO) else None
+        queue = self._queue
+        while queue:
+            task = queue.popleft()
             try:
-                self._logger.info("Starting stage '%s' for scene='%s' shot='%s'", task.stage.value, task.scene.name, getattr(task.shot, "name", None))
+                if log_info is not None:
+                    log_info("Starting stage '%s' for scene='%s' shot='%s'", task.stage.value, task.scene.name, getattr(task.shot, "name", None))
                 handler(task)
-                self._logger.info("Completed stage '%s' for scene='%s' shot='%s'", task.stage.value, task.scene.name, getattr(task.shot, "name", None))
+                if log_info is not None:
+                    log_info("Completed stage '%s' for scene='%s' shot='%s'", task.stage.value, task.scene.name, getattr(task.shot, "name", None))
             except Exception:  # pragma: no cover - defensive logging
                 self._logger.exception(
                     "Error while processing stage '%s' for scene='%s' shot='%s'",
@@ -76,7 +98,8 @@ class PipelineScheduler:
 
     def clear(self) -> None:
         """Remove all remaining tasks from the queue."""
-        self._logger.debug("Clearing %d remaining tasks", len(self._queue))
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("Clearing %d remaining tasks", len(self._queue))
         self._queue.clear()
 
     def __len__(self) -> int:  # pragma: no cover - trivial